@@ -104,6 +104,9 @@ WI4MPI_DIR = Path(USER_PREFIX) / "wi4mpi"
 WI4MPI_DEFAULT_INSTALL_DIR = WI4MPI_DIR / 'install'
 """Default installation directory for Wi4MPI"""
 
+SAMPLE_DIR = Path(USER_PREFIX) / "samples"
+"""Directory in which sample programs compiled by init are kept"""
+
 
 def version_banner():
     """Return a human readable text banner describing the E4S Container Launcher installation."""
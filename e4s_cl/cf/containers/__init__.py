@@ -504,18 +504,40 @@ class Container:
         having jsm_pmix/container && lib makes it error out.
         unrelative returns a list of all the paths required for such a file
         """
-        if not path:
-            return
+        self.bind_files([(path, dest, option)])
 
-        new_binds = set()
-        if not dest:
-            for _path in _unrelative(path):
-                new_binds.add(BoundFile(_path, _path, option))
-        else:
-            new_binds.add(BoundFile(Path(path), Path(dest), option))
+    def bind_files(
+        self, files: Iterable[Tuple[Union[Path, str], Optional[Path], int]]
+    ) -> None:
+        """
+        Bind multiple files at once. `files` is an iterable of
+        (path, destination, option) tuples, with the same semantics as the
+        arguments of `bind_file`.
+
+        Requests binding the same origin to the same destination are merged,
+        keeping the highest option; the resulting binds are then added as
+        `bind_file` would, in order.
+        """
+        # Options of the binds to add, indexed by (origin, destination)
+        new_binds = {}
+
+        def _add(origin: Path, destination: Path, option: int) -> None:
+            key = (origin, destination)
+            new_binds[key] = max(option, new_binds.get(key, option))
+
+        for path, dest, option in files:
+            if not path:
+                continue
+
+            if not dest:
+                for _path in _unrelative(path):
+                    _add(_path, _path, option)
+            else:
+                _add(Path(path), Path(dest), option)
 
-        for bind in new_binds:
-            self._bound_files = optimize_bind_addition(bind, self._bound_files)
+        for (origin, destination), option in new_binds.items():
+            self._bound_files = optimize_bind_addition(
+                BoundFile(origin, destination, option), self._bound_files)
 
     @property
     def bound(self):
@@ -124,28 +124,28 @@ class ShifterContainer(Container):
                              str(file.origin), str(file.destination))
                 continue
 
-            if file.destination.as_posix().startswith(CONTAINER_DIR):
-                rebased = file.destination.as_posix()[len(CONTAINER_DIR) + 1:]
-                temporary = Path(where, rebased)
+            origin = file.origin.as_posix()
+            destination = file.destination.as_posix()
 
-                LOGGER.debug("Shifter: Creating %s for %s in %s",
-                             temporary.as_posix(), file.origin.as_posix(),
-                             file.destination.as_posix())
+            if destination.startswith(CONTAINER_DIR):
+                rebased = destination[len(CONTAINER_DIR) + 1:]
+                temporary = Path(where, rebased)
                 os.makedirs(temporary.parent, exist_ok=True)
-                with subprocess.Popen(
-                    ['cp', '-r',
-                     file.origin.as_posix(),
-                     temporary.as_posix()]) as proc:
+                temporary = temporary.as_posix()
+
+                LOGGER.debug("Shifter: Creating %s for %s in %s", temporary,
+                             origin, destination)
+                with subprocess.Popen(['cp', '-r', origin,
+                                       temporary]) as proc:
                     proc.wait()
 
             elif file.origin.is_dir():
-                if file.destination.as_posix().startswith('/etc'):
+                if destination.startswith('/etc'):
                     LOGGER.error(
                         "Shifter: Backend does not support binding to '/etc'")
                     continue
 
-                volumes.append(
-                    (file.origin.as_posix(), file.destination.as_posix()))
+                volumes.append((origin, destination))
 
             else:
                 LOGGER.warning(
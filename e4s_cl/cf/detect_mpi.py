@@ -2,8 +2,10 @@
 Identify a MPI vendor and version from an ELF binary
 """
 
+import os
 import re
 import ctypes
+from functools import lru_cache
 from typing import Optional, Callable, Iterable, List, Set
 from dataclasses import dataclass
 from pathlib import Path
@@ -144,12 +146,18 @@ def _get_mpi_handle(path: Path) -> Optional[Callable]:
     if not path.exists():
         return None
 
+    return _load_mpi_handle(path.as_posix())
+
+
+@lru_cache(maxsize=8)
+def _load_mpi_handle(path: str) -> Optional[Callable]:
+    """Load the shared object at the given path and return its
+    MPI_Get_library_version symbol. Caches the result"""
     try:
-        handle = ctypes.CDLL(path.as_posix())
+        handle = ctypes.CDLL(path)
         return getattr(handle, 'MPI_Get_library_version', None)
     except OSError as err:
-        LOGGER.debug("Error loading shared object %s: %s", path.as_posix(),
-                     str(err))
+        LOGGER.debug("Error loading shared object %s: %s", path, str(err))
         return None
 
 
@@ -184,18 +192,16 @@ def _get_mpi_vendor_version(path: Path) -> Optional[MPIIdentifier]:
     binary passed as an argument"""
     raw_str = _get_mpi_library_version(path)
 
-    # Check for vendor keywords in the buffer
-    filtered_buffer = list(
-        filter(lambda x: x in raw_str, VENDOR_VERSION_EXTRACTORS.keys()))
+    # Check for vendor keywords in the buffer, and save the longest match
+    vendor_name = max(
+        (vendor for vendor in VENDOR_VERSION_EXTRACTORS if vendor in raw_str),
+        key=len,
+        default=None)
 
     # Skip this binary if none were found
-    if not filtered_buffer:
+    if vendor_name is None:
         return None
 
-    # Sort vendors by size, and save the longest match
-    filtered_buffer.sort(key=len, reverse=True)
-    vendor_name = filtered_buffer[0]
-
     # Run the corresponding function on the buffer
     # In case of an error, skip this function
     try:
@@ -209,8 +215,12 @@ def _get_mpi_vendor_version(path: Path) -> Optional[MPIIdentifier]:
 
 def detect_mpi(path_list: Iterable[Path]) -> Optional[MPIIdentifier]:
     """Parse the binaries from paths passed as arguments to get a `VENDOR@VERSION` string"""
+    # Profiles often list the same library under several names (libmpi.so,
+    # libmpi.so.40, ...): query each actual file only once
+    binaries = set(map(os.path.realpath, path_list))
+
     # Set of all MPI vendors and versions found in the binaries
-    version_data = set(filter(None, map(_get_mpi_vendor_version, path_list)))
+    version_data = set(filter(None, map(_get_mpi_vendor_version, binaries)))
 
     # If one consistent vendor has been found
     if len(version_data) == 1:
@@ -3,10 +3,13 @@ Library analysis and manipulation helpers
 """
 
 from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet
 
 # Symbols imported for ease of use
 # pylint: disable=W0611
-from sotools import is_elf, library_links
+from sotools import is_elf
+from sotools import library_links as _library_links
 # pylint: disable=W0611
 from sotools.ldd import ldd
 # pylint: disable=W0611
@@ -24,7 +27,7 @@ from e4s_cl.util import JSON_HOOKS
 LOGGER = get_logger(__name__)
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def libc_version():
     """
     -> e4s_cl.cf.version.Version
@@ -44,3 +47,41 @@ def libc_version():
                [Version(s) for s in data.defined_versions]))
 
     return libc_ver
+
+
+class _ByPath:
+    """
+    Library wrapper hashed and compared on the path of the library, as
+    libraries compare equal on their soname
+    """
+
+    __slots__ = ('library', )
+
+    def __init__(self, library: Library):
+        self.library = library
+
+    def __hash__(self):
+        return hash(self.library.binary_path)
+
+    def __eq__(self, other):
+        return self.library.binary_path == other.library.binary_path
+
+
+@lru_cache(maxsize=1024)
+def _cached_links(shared_object: _ByPath) -> FrozenSet[Path]:
+    return frozenset(_library_links(shared_object.library))
+
+
+def library_links(shared_object: Library) -> FrozenSet[Path]:
+    """
+    -> frozenset(pathlib.Path)
+    List the symbolic links pointing to the library passed as an argument.
+    Caches the result by library path, as listing the links requires a glob
+    of the library's directory. Use `library_links.cache_clear()` to
+    invalidate the cache.
+    """
+    return _cached_links(_ByPath(shared_object))
+
+
+library_links.cache_clear = _cached_links.cache_clear
+library_links.cache_info = _cached_links.cache_info
@@ -244,9 +244,10 @@ def wi4mpi_libpath(install_dir: Path):
     Select all WI4MPI-relevant elements from the LD_LIBRARY_PATH
     """
     ld_library_path = os.environ.get('LD_LIBRARY_PATH', '').split(':')
+    install_dir_str = install_dir.as_posix()
 
     for filename in ld_library_path:
-        if install_dir.as_posix() in filename:
+        if install_dir_str in filename:
             yield Path(filename)
 
 
@@ -2,6 +2,7 @@
 Module home of the argument parser methods and helpers
 """
 
+import os
 import sys
 import re
 import copy
@@ -631,7 +632,28 @@ def existing_posix_path(string):
 def existing_posix_path_list(string):
     """Argument type callback.
     Asserts that the string corresponds to a list of existing paths."""
-    return list(map(existing_posix_path, string.split(',')))
+    paths = [Path(element.strip()) for element in string.split(',')]
+
+    # List the contents of every parent directory once instead of checking
+    # each path on its own
+    listings = {}
+    for parent in {path.parent for path in paths}:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {
+                    entry.name
+                    for entry in entries if not entry.is_symlink()
+                }
+        except OSError:
+            listings[parent] = set()
+
+    for path in paths:
+        # Symbolic links and special names are checked individually
+        if path.name not in listings[path.parent] and not path.exists():
+            raise argparse.ArgumentTypeError(
+                f"File {path.as_posix()} does not exist")
+
+    return paths
 
 
 def binary_in_path(string):
@@ -557,11 +557,7 @@ class DumpCommand(AbstractCliView):
 
     def _construct_parser(self):
         key_str = self.model_name + '_' + self.model.key_attribute
-        usage_head = (
-            "%(command)s [%(key_str)s] [%(key_str)s] ... [arguments]" % {
-                'command': self.command,
-                'key_str': key_str
-            })
+        usage_head = f"{self.command} [{key_str}] [{key_str}] ... [arguments]"
         parser = arguments.get_parser(prog=self.command,
                                       usage=usage_head,
                                       description=self.summary)
@@ -6,8 +6,9 @@ argument.
 This command is used internally and thus cloaked from the UI
 """
 
-from typing import Union, List
+from typing import Union, List, Optional, Set, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from sotools.linker import resolve
 from sotools.libraryset import LibrarySet, Library
 from e4s_cl import (
@@ -36,19 +37,39 @@ LOGGER = logger.get_logger(__name__)
 _SCRIPT_CMD = Path(E4S_CL_SCRIPT).name
 
 
-def import_library(shared_object, container):
+def import_library(
+        shared_object,
+        container,
+        bound: Optional[Set[Path]] = None) -> List[Tuple[Path, Path, int]]:
     """
-    This method binds the shared object it got as an argument, along with all
-    the symbolic links that may exist and point to the same file.
+    This method lists the binds required to import the shared object it got
+    as an argument, along with all the symbolic links that may exist and
+    point to the same file. The returned list is meant to be passed to
+    `container.bind_files`.
 
     This is because depending on the linker at compile-time some binaries
     require more or less precise versions of the same file (eg. libmpi.so for
     some and libmpi.so.12 for others). Binding all the references ensures the
     library is found down the line.
+
+    If a set is passed as `bound`, destinations it contains are skipped, and
+    the destinations of the returned binds are added to it. This allows
+    sharing it across calls to avoid binding the same link twice.
     """
+    if bound is None:
+        bound = set()
+
+    import_dir = container.import_library_dir
+
+    binds = []
     for file in library_links(shared_object):
-        container.bind_file(file, Path(container.import_library_dir,
-                                       file.name))
+        dest = import_dir / file.name
+        if dest in bound:
+            continue
+        bound.add(dest)
+        binds.append((file, dest, FileOptions.READ_ONLY))
+
+    return binds
 
 
 # pylint: disable=unused-argument
@@ -62,13 +83,10 @@ def filter_libraries(library_set, container, entrypoint):
     in a newer glibc environment
     """
 
-    filtered_set = LibrarySet(library_set)
-
     # Remove libc-tied libraries from the filtered set, including the linker
-    for lib in library_set.glib:
-        filtered_set.remove(lib)
+    glib = frozenset(library_set.glib)
 
-    return filtered_set
+    return LibrarySet(lib for lib in library_set if lib not in glib)
 
 
 def overlay_libraries(library_set, container, entrypoint):
@@ -112,9 +130,10 @@ def overlay_libraries(library_set, container, entrypoint):
     paths = filter(None, map(resolve, glib_sonames))
     glib_set = LibrarySet.create_from(paths)
 
+    import_dir = container.import_binary_dir
+
     # Import the bash binary in the container
-    entrypoint.interpreter = Path(container.import_binary_dir,
-                                  'bash').as_posix()
+    entrypoint.interpreter = Path(import_dir, 'bash').as_posix()
     container.bind_file(bash_binary.pop().binary_path,
                         dest=entrypoint.interpreter)
 
@@ -130,17 +149,20 @@ def overlay_libraries(library_set, container, entrypoint):
 
     # Override linkers in the container
     for linker in selected.linkers:
-        entrypoint.linker = Path(container.import_binary_dir,
+        entrypoint.linker = Path(import_dir,
                                  Path(linker.binary_path).name).as_posix()
         container.bind_file(linker.binary_path, dest=entrypoint.linker)
 
     # Override the container's glib with the host's
+    overrides = []
     for lib in selected.glib | glib_set:
-        if lib.soname in container.cache:
-            LOGGER.debug("Overriding guest `%s` with host `%s`",
-                         container.cache[lib.soname], lib.binary_path)
-            container.bind_file(lib.binary_path,
-                                dest=container.cache[lib.soname])
+        guest_path = container.cache.get(lib.soname)
+        if guest_path:
+            LOGGER.debug("Overriding guest `%s` with host `%s`", guest_path,
+                         lib.binary_path)
+            overrides.append(
+                (lib.binary_path, guest_path, FileOptions.READ_ONLY))
+    container.bind_files(overrides)
 
     # Remove all the glib libraries from the import list as they have been
     # bound above
@@ -179,6 +201,9 @@ def select_libraries(library_set, container, entrypoint):
 
     methods = {host_newer: overlay_libraries, guest_newer: filter_libraries}
 
+    # Matching versions are handled by filter_libraries: the library set
+    # cannot be returned unchanged, as the host's libc-tied libraries would
+    # then be imported next to the guest's linker
     host_precedence = host_libc > guest_libc
 
     LOGGER.debug("Host libc: %s %s Guest libc: %s", str(host_libc),
@@ -201,10 +226,8 @@ def generate_rtld_path(container: Container,
     path_list = []
 
     if wi4mpi_install_dir is not None:
-        wi4mpi_paths = list(
-            map(lambda x: x.as_posix(), wi4mpi_libpath(wi4mpi_install_dir)))
-
-        path_list += wi4mpi_paths
+        path_list.extend(
+            path.as_posix() for path in wi4mpi_libpath(wi4mpi_install_dir))
 
     if hasattr(container.__class__, 'linker_path'):
         path_list += container.__class__.linker_path
@@ -272,6 +295,9 @@ class ExecuteCommand(AbstractCommand):
     def main(self, argv):
         args = self._parse_args(argv)
 
+        # Symlinks may have changed since the last invocation
+        library_links.cache_clear()
+
         # This object automatically mutates to one of the defined container
         # classes, and holds information about what is bound to the future
         # container launch
@@ -293,14 +319,11 @@ class ExecuteCommand(AbstractCommand):
         # is used in the container to check version mismatches
         required_libraries = [*args.libraries, *wi4mpi_required]
         libset = LibrarySet.create_from(required_libraries)
-        if libset:
-            # Analyze the container to get library information from the environment
-            # it offers, using the entrypoint and the above libraries
-            container.get_data()
 
         # Bind all accessible requested files
-        for path in filter(_check_access, args.files or []):
-            container.bind_file(path, option=FileOptions.READ_WRITE)
+        container.bind_files(
+            (path, None, FileOptions.READ_WRITE)
+            for path in filter(_check_access, args.files or []))
 
         # This script is sourced before any other command in the container
         params.source_script_path = args.source
@@ -315,21 +338,30 @@ class ExecuteCommand(AbstractCommand):
         # then filtering it according to the contents of the container
         final_libset = select_libraries(libset, container, params)
 
+        # List the symlinks of the libraries concurrently, as it requires a
+        # glob of the directory of each library
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(library_links, final_libset))
+
         # Import each library along with all symlinks pointing to it
+        library_binds, bound = [], set()
         for shared_object in final_libset:
-            import_library(shared_object, container)
+            library_binds.extend(
+                import_library(shared_object, container, bound))
+        container.bind_files(library_binds)
 
         if wi4mpi_install_dir is None:
             # Preload the top-level libraries of the imported set to bypass
             # any potential RPATH settings
+            import_dir = container.import_library_dir
+
             def _path(library: Library):
-                return Path(container.import_library_dir,
+                return Path(import_dir,
                             Path(library.binary_path).name).as_posix()
 
             if config.CONFIGURATION.preload_root_libraries:
-                for imported_library_path in map(_path,
-                                                 final_libset.top_level):
-                    params.preload.append(imported_library_path)
+                params.preload.extend(
+                    _path(library) for library in final_libset.top_level)
         else:
             # If WI4MPI is found in the environment, import its files and
             # preload its required components
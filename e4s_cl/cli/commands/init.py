@@ -29,6 +29,11 @@ paths and dependencies are valid and loaded.
     libraries, preventing them from being detected. A message will appear in \
     case some limitations were detected.
 
+The :code:`--quick` option skips the execution of the sample program and \
+creates the profile from the dependencies of the MPI library, as listed in \
+its ELF headers. This is much faster, but files and libraries opened at \
+runtime will not be detected.
+
 If no name is passed to :code:`--profile`, a :ref:`profile<profile>` \
 name will be generated from the version of the found MPI library.
 
@@ -70,11 +75,14 @@ import json
 import tempfile
 import subprocess
 import shlex
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from sotools.linker import resolve
+from sotools.libraryset import LibrarySet
 from e4s_cl import (EXIT_FAILURE, EXIT_SUCCESS, E4S_CL_SCRIPT,
-                    INIT_TEMP_PROFILE_NAME)
+                    INIT_TEMP_PROFILE_NAME, SAMPLE_DIR)
 from e4s_cl import logger, util
 from e4s_cl.cf.assets import precompiled_binaries, builtin_profiles
 from e4s_cl.cf.detect_mpi import (
@@ -86,60 +94,150 @@ from e4s_cl.cf.containers import guess_backend, EXPOSED_BACKENDS
 from e4s_cl.cli.arguments import (binary_in_path, posix_path, get_parser,
                                   SUPPRESS, REMAINDER)
 from e4s_cl.cli.command import AbstractCommand
-from e4s_cl.cli.commands.profile.detect import COMMAND as detect_command
+from e4s_cl.cli.commands.profile.detect import (COMMAND as detect_command,
+                                                save_to_profile)
 from e4s_cl.error import (UniqueAttributeError, ModelError)
 from e4s_cl.model.profile import Profile
 from e4s_cl.sample import PROGRAM
 
 LOGGER = logger.get_logger(__name__)
 _SCRIPT_CMD = os.path.basename(E4S_CL_SCRIPT)
+_PROGRAM_BYTES = PROGRAM.encode('utf-8')
+
+
+def _sample_path(compiler) -> Optional[Path]:
+    """
+    Path at which the sample compiled with the given compiler is kept
+    """
+    try:
+        mtime = os.stat(compiler).st_mtime_ns
+    except OSError:
+        return None
+
+    key = util.hash256(f"{Path(compiler).resolve()}|{mtime}|{PROGRAM}")
+    return Path(SAMPLE_DIR, key[:16])
 
 
 def _compile_sample(compiler) -> Path:
     """
     Compile a sample MPI program that can be used with the profile detect command
     """
-    # Create a file to compile a sample program in
-    with tempfile.NamedTemporaryFile('w+', delete=False) as binary:
-        with tempfile.NamedTemporaryFile('w+', suffix='.c') as program:
-            program.write(PROGRAM)
-            program.seek(0)
+    # Re-use a binary compiled with the same compiler
+    cached = _sample_path(compiler)
+    if cached and os.access(cached, os.X_OK):
+        LOGGER.debug("Using sample binary %s", cached.as_posix())
+        return cached.as_posix()
+
+    # Compile in the sample directory if possible, to move the binary in
+    # place once compiled
+    directory = None
+    if cached and util.mkdirp(SAMPLE_DIR):
+        directory = SAMPLE_DIR
 
-            command = "%(compiler)s -o %(output)s -lm %(code)s" % {
-                'compiler': compiler,
-                'output': binary.name,
-                'code': program.name,
-            }
-
-            LOGGER.debug("Compiling with: '%s'", command)
-            with subprocess.Popen(command.split()) as compilation:
-                compilation_status = compilation.wait()
+    # Create a file to compile a sample program in
+    with tempfile.NamedTemporaryFile('w+', delete=False,
+                                     dir=directory) as binary:
+        # The source is read from stdin
+        command = [compiler, '-o', binary.name, '-x', 'c', '-', '-lm']
+
+        # close_fds defaults to True; passing False lets subprocess use
+        # posix_spawn instead of fork. Descriptors e4s-cl inherited as
+        # inheritable are then passed on to the compiler
+        LOGGER.debug("Compiling with: '%s'", " ".join(command))
+        compilation = subprocess.run(command,
+                                     input=_PROGRAM_BYTES,
+                                     stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.PIPE,
+                                     close_fds=False,
+                                     check=False)
 
     # Check for a non-zero return code
-    if compilation_status:
+    if compilation.returncode:
         LOGGER.error(
             "Failed to compile sample MPI program with the following compiler: %s",
             compiler)
+        LOGGER.error("Compiler output: %s",
+                     compilation.stderr.decode(errors='replace'))
+        os.unlink(binary.name)
         return None
 
+    if directory:
+        os.replace(binary.name, cached)
+        return cached.as_posix()
+
     return binary.name
 
 
-def _check_mpirun(executable):
+def _scheduler_hosts() -> Optional[int]:
+    """
+    Count the hosts allocated by the batch scheduler, if any
+    """
+    nodes = os.environ.get('SLURM_JOB_NUM_NODES', '')
+    if nodes.isdigit():
+        return int(nodes)
+
+    nodefile = os.environ.get('PBS_NODEFILE')
+    if nodefile:
+        try:
+            with open(nodefile, encoding='utf-8') as hosts:
+                return len({host.strip() for host in hosts if host.strip()})
+        except OSError as err:
+            LOGGER.debug("Failed to read %s: %s", nodefile, str(err))
+
+    lsb_hosts = os.environ.get('LSB_HOSTS', '').split()
+    if lsb_hosts:
+        return len(set(lsb_hosts))
+
+    return None
+
+
+# Seconds given to the launcher to exit once terminated, before killing it
+_LAUNCHER_TERMINATION_TIMEOUT = 5
+
+
+@lru_cache()
+def _launcher_hosts(executable) -> Optional[int]:
     """
-    Run hostname with the launcher and list the affected nodes
+    Count the hosts used by the launcher by default. The scheduler's
+    allocation is used when available, otherwise hostname is run with the
+    launcher and the affected nodes are listed. In the latter case, the
+    launcher is stopped as soon as two distinct hosts are seen, so the count
+    is capped at 2
     """
+    hosts = _scheduler_hosts()
+    if hosts is not None:
+        return hosts
+
     hostname_bin = util.which('hostname')
     if not hostname_bin:
-        return
+        return None
 
+    hostnames = set()
+    # As for the compiler, disable close_fds to allow the use of posix_spawn;
+    # inheritable descriptors are passed on to the launcher. The launcher may
+    # complain about being terminated, so its error output is discarded
     with subprocess.Popen([executable, hostname_bin],
-                          stdout=subprocess.PIPE) as proc:
-        proc.wait()
+                          stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL,
+                          close_fds=False) as proc:
+        for hostname in proc.stdout:
+            hostnames.add(hostname.strip())
+            if len(hostnames) > 1:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=_LAUNCHER_TERMINATION_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                break
+
+    return len(hostnames)
 
-        hostnames = {hostname.strip() for hostname in proc.stdout.readlines()}
 
-    if len(hostnames) == 1:
+def _check_mpirun(executable):
+    """
+    Warn if the launcher uses a single host by default
+    """
+    if _launcher_hosts(executable) == 1:
         LOGGER.warning(
             "The target launcher %s uses a single host by default, "
             "which may tamper with the library discovery. Consider "
@@ -147,16 +245,20 @@ def _check_mpirun(executable):
             str(detect_command))
 
 
+# Destinations of the arguments copied as-is in the created profile, in a
+# fixed order as the profile's serialization is hashed to name it
+_PROFILE_OPTIONS = ('image', 'backend', 'source', 'wi4mpi')
+
+
 def _profile_from_args(args) -> dict:
     """
     Create a dictionnary with all the profile related information passed as arguments
     """
-    data = {}
-
-    for attr in ['image', 'backend', 'source', 'wi4mpi']:
-        value = getattr(args, attr, None)
-        if value:
-            data[attr] = value
+    values = vars(args)
+    data = {
+        attr: values[attr]
+        for attr in _PROFILE_OPTIONS if values.get(attr)
+    }
 
     # Determine the backend if possible
     if data.get('image') and not data.get('backend'):
@@ -171,10 +273,13 @@ def _profile_from_args(args) -> dict:
 
 
 def _select_binary(binary_dict):
-    # Selects an available mpi vendor
-    for libso in binary_dict.keys():
-        if resolve(libso) is not None:
-            return str(binary_dict[libso])
+    # Selects an available mpi vendor. The sonames are resolved
+    # concurrently, and the first available in the dict's order is used
+    with ThreadPoolExecutor() as executor:
+        resolved = executor.map(resolve, binary_dict.keys())
+        for libso, path in zip(binary_dict.keys(), resolved):
+            if path is not None:
+                return str(binary_dict[libso])
     LOGGER.debug(
         "MPI vendor not supported by precompiled binary initialisation\n"
         "Proceeding with legacy initialisation")
@@ -203,30 +308,95 @@ def _analyze_binary(args):
     return EXIT_SUCCESS
 
 
+def _analyze_library(args):
+    # Create the profile from the dependencies of the MPI library, as
+    # resolved from its ELF headers, without running any program
+    mpi_library = None
+    if getattr(args, 'mpi', None):
+        candidates = sorted(Path(args.mpi, 'lib').glob('libmpi.so*'))
+        if candidates:
+            mpi_library = candidates[0].as_posix()
+    else:
+        mpi_library = resolve('libmpi.so')
+
+    if not mpi_library:
+        LOGGER.error(
+            "No MPI library detected. Please load a module or "
+            "use the `--mpi` option to specify the MPI installation to use.")
+        return EXIT_FAILURE
+
+    LOGGER.info("Listing the dependencies of %s", mpi_library)
+    libraries = LibrarySet.create_from([mpi_library])
+
+    if not libraries.complete:
+        LOGGER.warning("Failed to resolve dependencies of %s: %s",
+                       mpi_library, ", ".join(libraries.missing_libraries))
+
+    return save_to_profile(
+        None, (lib.binary_path for lib in libraries if lib.binary_path), [])
+
+
+def _which_many(names: Iterable[str]) -> Dict[str, str]:
+    """
+    Locate the given executables in PATH, listing each directory once.
+    Returns the paths of the executables found, by name
+    """
+    wanted = set(names)
+    found = {}
+
+    for directory in os.get_exec_path():
+        if not wanted:
+            break
+
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    if (entry.name in wanted and entry.is_file()
+                            and os.access(entry.path, os.X_OK)):
+                        found[entry.name] = entry.path
+                        wanted.discard(entry.name)
+        except OSError:
+            continue
+
+    return found
+
+
 def _generate_command(args):
     """
     Generate a command from the given args with a launcher and mpi binary
     - compiling a binary if necessary
     """
-    # Use the MPI environment scripts by default
-    compiler = util.which('mpicc')
-    launcher = util.which('mpirun')
+    compiler, launcher = None, None
 
     # If a library is specified, get the executables
     if getattr(args, 'mpi', None):
-        mpicc = Path(args.mpi) / "bin" / "mpicc"
-        if mpicc.exists():
-            compiler = mpicc.as_posix()
+        # List the binary directory once instead of probing each executable
+        mpi_bin = Path(args.mpi) / "bin"
+        try:
+            with os.scandir(mpi_bin) as entries:
+                bin_entries = {entry.name for entry in entries}
+        except OSError:
+            bin_entries = set()
 
-        mpirun = Path(args.mpi) / "bin" / "mpirun"
-        if mpirun.exists():
-            launcher = mpirun.as_posix()
+        if 'mpicc' in bin_entries:
+            compiler = (mpi_bin / 'mpicc').as_posix()
+
+        if 'mpirun' in bin_entries:
+            launcher = (mpi_bin / 'mpirun').as_posix()
 
         # Update LD_LIBRARY_PATH if provided path exist
         mpi_lib = Path(args.mpi) / "lib"
         if mpi_lib.exists():
             os.environ["LD_LIBRARY_PATH"] = mpi_lib.as_posix()
 
+    # Use the MPI environment scripts by default, only looking up the ones
+    # the installation did not provide
+    in_path = _which_many(
+        name for name, path in (('mpicc', compiler), ('mpirun', launcher))
+        if not path)
+    compiler = compiler or in_path.get('mpicc')
+    launcher = launcher or in_path.get('mpirun')
+
     # Select binary depending on available library
     binary = _select_binary(precompiled_binaries())
 
@@ -237,19 +407,12 @@ def _generate_command(args):
 
     launcher_args = shlex.split(getattr(args, 'launcher_args', ''))
 
-    # If no binary, check for compiler and compile a binary
-    if not binary:
-        if not compiler:
-            LOGGER.error(
-                "No MPI compiler detected. Please load a module or "
-                "use the `--mpi` option to specify the MPI installation to use."
-            )
-            return []
-        binary = _compile_sample(compiler)
-
-        # Exit now if we failed producing a compatible binary
-        if not binary:
-            return []
+    # If no binary, check for a compiler to compile one
+    if not binary and not compiler:
+        LOGGER.error(
+            "No MPI compiler detected. Please load a module or "
+            "use the `--mpi` option to specify the MPI installation to use.")
+        return []
 
     # Check for launcher and then launch the detect command
     if not launcher:
@@ -261,9 +424,23 @@ def _generate_command(args):
     LOGGER.info("Tracing MPI execution using:\nCompiler: %s\nLauncher: %s",
                 compiler, " ".join([launcher, *launcher_args]))
 
-    # If no arguments were given, check the default behaviour of the launcher
-    if not launcher_args:
-        _check_mpirun(launcher)
+    # Both steps below wait on subprocesses: run them concurrently
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # If no arguments were given, check the default behaviour of the
+        # launcher
+        check = None
+        if not launcher_args:
+            check = executor.submit(_check_mpirun, launcher)
+
+        if not binary:
+            binary = _compile_sample(compiler)
+
+        if check:
+            check.result()
+
+    # Exit now if we failed producing a compatible binary
+    if not binary:
+        return []
 
     # Run the program using the detect command and get a file list
     return [launcher, *launcher_args, binary]
@@ -321,23 +498,33 @@ def _rename_profile(profile: Profile, requested_name: Optional[str]) -> None:
     return True
 
 
+# Destinations of the mutually exclusive initialization options
+_SYSTEM_OPTIONS = frozenset({'system'})
+_DETECT_OPTIONS = frozenset({'mpi', 'cmd', 'launcher', 'launcher_args', 'quick'})
+
+# Destinations of the options used to run the sample program, ignored by --quick
+_TRACE_OPTIONS = frozenset({'cmd', 'launcher', 'launcher_args'})
+
+
 class InitCommand(AbstractCommand):
     """`init` macrocommand."""
 
     def _construct_parser(self):
         parser = get_parser(prog=self.command, description=self.summary)
 
+        systems = builtin_profiles().keys()
+
         parser.add_argument(
             '--system',
             help="Initialize e4s-cl for use on a specific system."
-            f" Available systems: {', '.join(builtin_profiles().keys())}" \
-                    if builtin_profiles().keys() else \
+            f" Available systems: {', '.join(systems)}" \
+                    if systems else \
                     "Initialize e4s-cl for use on a specific system."
                     " Use 'make install E4SCL_TARGETSYSTEM=<system>' to make "
                     " the associated profile available.",
             metavar='machine',
             default=SUPPRESS,
-            choices=builtin_profiles().keys())
+            choices=systems)
 
         parser.add_argument(
             '--launcher',
@@ -364,6 +551,16 @@ class InitCommand(AbstractCommand):
             metavar='/path/to/mpi',
         )
 
+        parser.add_argument(
+            '--quick',
+            help="Create the profile from the dependencies of the MPI library"
+            " instead of tracing a sample program. This is faster, but files"
+            " and libraries opened at runtime will be missing",
+            action='store_true',
+            default=SUPPRESS,
+            dest='quick',
+        )
+
         parser.add_argument(
             '--source',
             help="Script to source before execution with this profile",
@@ -418,15 +615,20 @@ class InitCommand(AbstractCommand):
     def main(self, argv):
         args = self._parse_args(argv)
 
-        system_args = getattr(args, 'system', False)
-        detect_args = (getattr(args, 'mpi', False)
-                       or getattr(args, 'cmd', False)
-                       or getattr(args, 'launcher', False)
-                       or getattr(args, 'launcher_args', False))
+        # Arguments given on the command line, by destination
+        given = {key for key, value in vars(args).items() if value}
+
+        system_args = bool(given & _SYSTEM_OPTIONS)
+        detect_args = bool(given & _DETECT_OPTIONS)
 
         if system_args and detect_args:
             self.parser.error(
-                "--system and --mpi / --launcher / --launcher_args options are mutually exclusive"
+                "--system and --mpi / --launcher / --launcher_args / --quick options are mutually exclusive"
+            )
+
+        if 'quick' in given and given & _TRACE_OPTIONS:
+            self.parser.error(
+                "--quick and --launcher / --launcher_args / command options are mutually exclusive"
             )
 
         profile_data = _profile_from_args(args)
@@ -439,8 +641,11 @@ class InitCommand(AbstractCommand):
 
         controller = Profile.controller()
 
-        # Erase any leftover temporary profiles
-        controller.delete({"name": profile_data['name']})
+        # Erase any leftover temporary profiles. Every removal rewrites the
+        # database file, so skip it when there is nothing to erase
+        leftover = controller.one({"name": profile_data['name']})
+        if leftover:
+            controller.delete(leftover.eid)
 
         # Create and select a profile for use
         profile = controller.create(profile_data)
@@ -450,7 +655,10 @@ class InitCommand(AbstractCommand):
 
         if not system_args and _skip_analysis(args):
             try:
-                status = _analyze_binary(args)
+                if getattr(args, 'quick', False):
+                    status = _analyze_library(args)
+                else:
+                    status = _analyze_binary(args)
             except KeyboardInterrupt:
                 status = EXIT_FAILURE
 
@@ -72,10 +72,7 @@ from e4s_cl.cli.commands.profile.detect import COMMAND as detect_command
 
 def _profile_fields():
     for name, data in Profile.__attributes__().items():
-        yield " - %(name)s: %(description)s" % {
-            'name': name.capitalize(),
-            'description': data['description'].capitalize()
-        }
+        yield f" - {name.capitalize()}: {data['description'].capitalize()}"
 
 
 HELP_PAGE = """The profile command is used to access and manage profiles.
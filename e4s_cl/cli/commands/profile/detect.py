@@ -49,7 +49,6 @@ from e4s_cl import variables
 from e4s_cl.error import ProfileSelectionError
 from e4s_cl.util import (run_e4scl_subprocess, flatten, json_dumps, json_loads,
                          path_contains, apply_filters)
-from e4s_cl.cf.trace import opened_files
 from e4s_cl.cf.launchers import interpret, get_reserved_directories
 from e4s_cl.cli import arguments
 from e4s_cl.model.profile import Profile
@@ -276,7 +275,9 @@ class ProfileDetectCommand(AbstractCliView):
         else:
             launcher = os.environ.get(LAUNCHER_VAR, '').split(' ')
 
-            # No launcher, analyse the command
+            # No launcher, analyse the command. The tracing module depends on
+            # python-ptrace, which is only imported when needed
+            from e4s_cl.cf.trace import opened_files
             return_code, accessed_files = opened_files(args.cmd)
 
             if return_code:
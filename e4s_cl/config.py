@@ -229,6 +229,12 @@ ALLOWED_CONFIG = ConfigurationGroup(
             lambda: False,
             "Disable logging on the work nodes",
         ),
+        ConfigurationField(
+            "log_file_level",
+            str,
+            lambda: "DEBUG",
+            "Minimum level of the messages written to the log files",
+        ),
         ConfigurationGroup(
             "wi4mpi",
             {
@@ -13,16 +13,17 @@ a rotating debug file in the user's E4S CL directory, typically "~/.local/e4s_cl
 import os
 import re
 import sys
-import time
 import textwrap
 import socket
 import platform
+import shutil
 import string
 import logging
-import hashlib
+import secrets
 import atexit
 from pathlib import Path
-from time import time
+from functools import lru_cache
+from typing import Callable, Optional
 from logging import handlers
 from datetime import datetime
 from e4s_cl import USER_PREFIX, E4S_CL_VERSION
@@ -35,150 +36,143 @@ try:
 except ModuleNotFoundError:
     COLOR_OUTPUT = False
 
-# Use isatty to check if the stream supports color
-STDOUT_COLOR = os.isatty(sys.stdout.fileno())
-STDERR_COLOR = os.isatty(sys.stderr.fileno())
-
 # This is used all over the project, so name translation here
 get_logger = logging.getLogger
 
 WARNING = logging.WARNING
 ERROR = logging.ERROR
 
+# Matches ANSI control sequences (CSI), including but not limited to colors
+_ANSI_RE = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]')
+
+# Matches the whitespace TextWrapper replaces or drops from a line that fits
+_WRAP_SENSITIVE_RE = re.compile(r'[\t\n\x0b\x0c\r]|\s$')
+
+# Matches any character not in string.printable
+_NONPRINTABLE_RE = re.compile(f"[^{re.escape(string.printable)}]")
+
 
 def _prune_ansi(line: str) -> str:
     """
     Remove ANSI color codes from a string
     """
-    return re.sub(re.compile('\x1b[^m]+m'), '', line)
+    return _ANSI_RE.sub('', line)
 
 
 def get_terminal_size():
     """Discover the size of the user's terminal.
     
-    Several methods are attempted depending on the user's OS.
-    If no method succeeds then default to (80, 25).
+    The LINES and COLUMNS environment variables are used first, then the size
+    of the terminal attached to stdout, stderr or stdin. If no method succeeds
+    then default to (80, 25).
     
     Returns:
         tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters.
     """
     default_width = 80
     default_height = 25
-    dims = _get_term_size_env()
-
-    if not dims:
-        dims = _get_term_size_posix()
+    width, height = shutil.get_terminal_size(
+        _get_term_size_fallback() or (default_width, default_height))
 
-        if not dims:
-            dims = default_width, default_height
-
-    try:
-        dims = list(map(int, dims))
-    except ValueError:
-        dims = default_width, default_height
-
-    width = dims[0] if dims[0] >= 10 else default_width
-    height = dims[1] if dims[1] >= 1 else default_height
+    width = width if width >= 10 else default_width
+    height = height if height >= 1 else default_height
 
     return width, height
 
 
-def _get_term_size_tput():
-    """Discover the size of the user's terminal via `tput`_.
-    
+def _get_term_size_fallback():
+    """Discover the size of the terminal attached to stderr or stdin, used when
+    stdout is redirected (e.g. piped to `tee`).
+
     Returns:
         tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters,
                or None if the size could not be determined.
-               
-    .. _tput: http://stackoverflow.com/questions/263890/how-do-i-find-the-width-height-of-a-terminal-window
     """
+    for fd in (2, 0):
+        try:
+            return tuple(os.get_terminal_size(fd))
+        except OSError:
+            continue
+    return None
+
+
+def _isatty(stream) -> bool:
     try:
-        import subprocess
-        with subprocess.Popen(["tput", "cols"],
-                              stdin=subprocess.PIPE,
-                              stdout=subprocess.PIPE) as proc:
-            output = proc.communicate(input=None)
-        cols = int(output[0])
-        with subprocess.Popen(["tput", "lines"],
-                              stdin=subprocess.PIPE,
-                              stdout=subprocess.PIPE) as proc:
-            output = proc.communicate(input=None)
-        rows = int(output[0])
-        return (cols, rows)
-    except:  # pylint: disable=bare-except
-        return None
-
-
-def _get_term_size_posix():
-    """Discover the size of the user's terminal on a POSIX operating system (e.g. Linux).
-    
-    Returns:
-        tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters,
-               or None if the size could not be determined.
-    """
+        return os.isatty(stream.fileno())
+    except (AttributeError, OSError, ValueError):
+        return False
 
-    # This function follows a POSIX naming scheme, not Python's.
-    # pylint: disable=invalid-name
-    # Sometimes Pylint thinks termios doesn't exist or doesn't have certain members even when it does.
-    # pylint: disable=no-member
-    def ioctl_GWINSZ(fd):
-        try:
-            import fcntl
-            import termios
-            import struct
-            dims = struct.unpack('hh',
-                                 fcntl.ioctl(fd, termios.TIOCGWINSZ, '1234'))
-        except:  # pylint: disable=bare-except
-            return None
-        return dims
-
-    dims = ioctl_GWINSZ(0) or ioctl_GWINSZ(1) or ioctl_GWINSZ(2)
-    if not dims:
-        try:
-            fd = os.open(os.ctermid(), os.O_RDONLY)
-            dims = ioctl_GWINSZ(fd)
-            os.close(fd)
-        except:  # pylint: disable=bare-except
-            pass
-    if not dims:
-        return None
-    return int(dims[1]), int(dims[0])
 
+@lru_cache(maxsize=1)
+def stdout_color() -> bool:
+    """Use isatty to check if stdout supports color. Caches the result"""
+    return _isatty(sys.stdout)
 
-def _get_term_size_env():
-    """Discover the size of the user's terminal via environment variables.
-    
-    The user may set the LINES and COLUMNS environment variables to control E4S CL's
-    console dimension calculations.
-    
-    Returns:
-        tuple: (width, height) tuple giving the dimensions of the user's terminal window in characters,
-               or None if the size could not be determined.
+
+@lru_cache(maxsize=1)
+def stderr_color() -> bool:
+    """Use isatty to check if stderr supports color. Caches the result"""
+    return _isatty(sys.stderr)
+
+
+@lru_cache(maxsize=1)
+def term_size():
+    """(width, height) tuple of detected terminal dimensions in characters.
+    Caches the result"""
+    return get_terminal_size()
+
+
+def line_width() -> int:
+    """Width of a line on the terminal.
+
+    Uses system specific methods to determine console line width.  If the line
+    width cannot be determined, the default is 80.
     """
-    try:
-        return (int(os.environ['COLUMNS']), int(os.environ['LINES']))
-    except (KeyError, ValueError):
-        return None
+    return term_size()[0]
 
 
-def on_stdout(function):
+_LAZY_ATTRIBUTES = {
+    'STDOUT_COLOR': stdout_color,
+    'STDERR_COLOR': stderr_color,
+    'TERM_SIZE': term_size,
+    'LINE_WIDTH': line_width,
+}
 
-    def wrapper(obj, record):
-        text = function(obj, record)
-        if STDOUT_COLOR:
-            return text
-        return _prune_ansi(text)
 
-    return wrapper
+def __getattr__(name):
+    """Compute the terminal-related module attributes on first access only.
+    Assigning those attributes overrides the detected values."""
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def on_stdout(function):
+    """Mark a formatter method as outputting to stdout"""
+    function.color_check = stdout_color
+    return function
 
 
 def on_stderr(function):
+    """Mark a formatter method as outputting to stderr"""
+    function.color_check = stderr_color
+    return function
+
+
+@lru_cache(maxsize=256)
+def _colored_cached(text, *color_args):
+    """Memoized `termcolor.colored`"""
+    return termcolor.colored(text, *color_args)
+
+
+def _pruned(method):
+    """Wrap a formatter method to remove ANSI codes from its output"""
 
-    def wrapper(obj, record):
-        text = function(obj, record)
-        if STDERR_COLOR:
-            return text
-        return _prune_ansi(text)
+    # Bind the substitution once, as the wrapper runs for every record
+    strip = _ANSI_RE.sub
+
+    def wrapper(record):
+        return strip('', method(record))
 
     return wrapper
 
@@ -195,13 +189,15 @@ class LogFormatter(logging.Formatter):
     # Allow invalid function names to define member functions named after logging levels.
     # pylint: disable=invalid-name
 
-    _printable_chars = set(string.printable)
-
     def __init__(self, line_width=0, printable_only=False, allow_colors=True):
         super().__init__()
         self.printable_only = printable_only
         self.allow_colors = allow_colors
         self.line_width = line_width
+        # TextWrapper objects, indexed by width
+        self._wrappers = {}
+        # Formatting methods, indexed by level name
+        self._methods = {}
 
     @on_stderr
     def CRITICAL(self, record):
@@ -228,18 +224,23 @@ class LogFormatter(logging.Formatter):
         Print a debug message with a neat little header
         """
         message = record.getMessage()
-        if self.printable_only and (not set(message).issubset(
-                self._printable_chars)):
+        if self.printable_only and _NONPRINTABLE_RE.search(message):
             message = "<<UNPRINTABLE>>"
 
+        # Markers repeat for every record logged from the same place: color
+        # them through a cache
         if __debug__:
             marker = self._colored(
                 f"[{record.levelname.title()} {record.name}:{record.lineno}]",
-                'yellow')
+                'yellow',
+                cache=True)
         else:
             marker = self._colored(
                 f"[{record.levelname.title()} {getattr(record, 'host', 'localhost')}:{record.process}]",
-                'cyan', None, ['bold'])
+                'cyan',
+                None,
+                ('bold', ),
+                cache=True)
 
         return f"{marker} {message}"
 
@@ -256,13 +257,31 @@ class LogFormatter(logging.Formatter):
             RuntimeError: No format specified for a the record's logging level.
         """
         try:
-            return getattr(self, record.levelname)(record)
+            return self._level_method(record.levelname)(record)
         except AttributeError as exc:
             raise RuntimeError(
                 f"Unknown record level (name: {record.levelname})") from exc
 
-    def _colored(self, text, *color_args):
+    def _level_method(self, levelname):
+        """Return the method formatting records of the given level.
+
+        Whether its output has to be stripped of ANSI codes depends on the
+        stream it is destined to; this is checked on the first record of the
+        level only, to keep the terminal detection lazy.
+        """
+        method = self._methods.get(levelname)
+        if method is None:
+            method = getattr(self, levelname)
+            if not method.color_check():
+                method = _pruned(method)
+            self._methods[levelname] = method
+        return method
+
+    def _colored(self, text, *color_args, cache=False):
         """Insert ANSII color formatting via `termcolor`_.
+
+        If `cache` is set, the result is memoized. Use it for recurring text
+        only, and pass hashable color arguments.
         
         Text colors:
             * grey
@@ -296,13 +315,24 @@ class LogFormatter(logging.Formatter):
         """
         if (COLOR_OUTPUT and self.allow_colors and color_args
                 and not sys.stdout.closed):
+            if cache:
+                return _colored_cached(text, *color_args)
             return termcolor.colored(text, *color_args)
         return text
 
+    def _text_wrapper(self, width: int) -> textwrap.TextWrapper:
+        """Return a TextWrapper for the given width, creating it if needed"""
+        wrapper = self._wrappers.get(width)
+        if wrapper is None:
+            wrapper = textwrap.TextWrapper(width=width)
+            self._wrappers[width] = wrapper
+        return wrapper
+
     def _format_message(self, record, header=''):
         # Length of the header, pruned from invisible escape characters
         if self.line_width:
-            header_length = len(_prune_ansi(header))
+            header_length = len(
+                _prune_ansi(header) if '\x1b' in header else header)
 
             output = []
             text = record.getMessage().split("\n")
@@ -311,15 +341,25 @@ class LogFormatter(logging.Formatter):
             while len(text) > 1 and not text[-1]:
                 text.pop()
 
+            width = self.line_width - header_length
+            wrapper = self._text_wrapper(width)
             for line in text:
-                output += textwrap.wrap(line,
-                                        width=(self.line_width -
-                                               header_length))
+                # Most lines are short enough to be kept as-is: only wrap the
+                # others, or lines which whitespace would be rewritten
+                if (line and len(line) <= width
+                        and not _WRAP_SENSITIVE_RE.search(line)):
+                    output.append(line)
+                    continue
+
+                output += wrapper.wrap(line)
                 if not line:
                     output += ['']
 
-            return textwrap.indent("\n".join(output), header,
-                                   lambda line: True)
+            # Prefix every line with the header, except a trailing empty one
+            lines = [header + line for line in output]
+            if output and not output[-1]:
+                lines[-1] = ''
+            return "\n".join(lines)
         return textwrap.indent(record.getMessage().strip(), header,
                                lambda line: True)
 
@@ -337,6 +377,15 @@ def set_log_level(level):
     global LOG_LEVEL
     LOG_LEVEL = level.upper()
     _STDERR_HANDLER.setLevel(LOG_LEVEL)
+    _update_root_level()
+
+
+def _update_root_level():
+    """
+    Set the root logger's level to the lowest level its handlers accept, for
+    records no handler would output to be discarded before any processing
+    """
+    _ROOT_LOGGER.setLevel(min(_STDERR_HANDLER.level, FILE_LOG_LEVEL))
 
 
 def debug_mode():
@@ -357,22 +406,33 @@ LOG_INDEX = Path(USER_PREFIX, 'logs', 'index.tsv')
 
 LOG_LATEST = Path(USER_PREFIX, 'logs', 'latest')
 
-TERM_SIZE = get_terminal_size()
-"""tuple: (width, height) tuple of detected terminal dimensions in characters."""
-
-LINE_WIDTH = TERM_SIZE[0]
-"""Width of a line on the terminal.
-
-Uses system specific methods to determine console line width.  If the line
-width cannot be determined, the default is 80.
-"""
-
 LOG_ID_MARKER = "__E4S_CL_LOG_ID"
 """
 Environment variable name: set by the parent for every execution, is used to
 group debug logs in folders
 """
 
+def _file_log_level() -> int:
+    """
+    Level of the records written to the log files, from the configuration.
+    Defaults to DEBUG if the configured level is not recognized
+    """
+    level = logging.getLevelName(CONFIGURATION.log_file_level.upper())
+    if isinstance(level, int):
+        return level
+    return logging.DEBUG
+
+
+FILE_LOG_LEVEL = _file_log_level()
+"""int: Level of the records written to the log files."""
+
+FILE_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s [%(levelname)s %(name)s:%(lineno)d] %(message)s")
+"""
+Formatter for the records written to log files. Files are not subject to the
+terminal's width or colors, so the records skip the LogFormatter processing
+"""
+
 
 def setup_process_logger(name: str) -> logging.Logger:
     """
@@ -398,7 +458,7 @@ def setup_process_logger(name: str) -> logging.Logger:
                                       mode='a',
                                       encoding='utf-8',
                                       delay=True)
-        handler.setFormatter(LogFormatter(line_width=120, allow_colors=False))
+        handler.setFormatter(FILE_FORMATTER)
         process_logger.addHandler(handler)
 
         # This disables the propagation along the logger tree, to avoid getting
@@ -431,34 +491,124 @@ def is_available(file: Path) -> bool:
     return True
 
 
+class _LazyFileHandler(logging.Handler):
+    """
+    Rotating file handler deferring the creation of its log file until the
+    first record is emitted, sparing filesystem accesses to processes that
+    never log anything
+    """
+
+    def __init__(self,
+                 log_file: Path,
+                 formatter: logging.Formatter,
+                 header: Optional[Callable[[], str]] = None,
+                 level: int = logging.DEBUG):
+        super().__init__(level=level)
+        self.log_file = log_file
+        self.header = header
+        self._handler = None
+        self._unavailable = False
+        self.setFormatter(formatter)
+
+    def _setup(self) -> bool:
+        # Records emitted while checking the file must not re-enter the setup
+        self._unavailable = True
+
+        if not is_available(self.log_file):
+            return False
+
+        self._handler = handlers.TimedRotatingFileHandler(self.log_file,
+                                                          when='D',
+                                                          interval=1,
+                                                          backupCount=3)
+        self._handler.setFormatter(self.formatter)
+        self._unavailable = False
+
+        if self.header is not None:
+            self._handler.handle(
+                logging.makeLogRecord({
+                    'name': _ROOT_LOGGER.name,
+                    'levelno': logging.DEBUG,
+                    'levelname': logging.getLevelName(logging.DEBUG),
+                    'msg': self.header(),
+                }))
+
+        return True
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        if self._handler is not None:
+            self._handler.setFormatter(fmt)
+
+    def emit(self, record):
+        if self._unavailable:
+            return
+
+        if self._handler is None and not self._setup():
+            return
+
+        self._handler.emit(record)
+
+    def close(self):
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
+
+
 def add_file_handler(
     log_file: Path,
     logger: logging.Logger,
-    formatter: logging.Formatter = LogFormatter(line_width=120,
-                                                allow_colors=False)
-) -> bool:
+    formatter: logging.Formatter = FILE_FORMATTER,
+    header: Optional[Callable[[], str]] = None,
+    level: int = logging.DEBUG,
+) -> None:
     """
-    Add a file handler to a Logger object
+    Add a file handler to a Logger object, outputting records of the given
+    level and above. The file is created when the first record is emitted,
+    preceded by the output of `header` if given
     """
-    if not is_available(log_file):
-        return False
+    logger.addHandler(_LazyFileHandler(log_file, formatter, header, level))
 
-    file_handler = handlers.TimedRotatingFileHandler(log_file,
-                                                     when='D',
-                                                     interval=1,
-                                                     backupCount=3)
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
 
-    return True
+def _banner() -> str:
+    """
+    Describe the execution environment, to head the debug log
+    """
+    return ("\n%(bar)s\n"
+            "E4S CONTAINER LAUNCHER LOGGING INITIALIZED\n"
+            "\n"
+            "Timestamp         : %(timestamp)s\n"
+            "Hostname          : %(hostname)s\n"
+            "Platform          : %(platform)s\n"
+            "Version           : %(version)s\n"
+            "Python Version    : %(pyversion)s\n"
+            "Working Directory : %(cwd)s\n"
+            "Terminal Size     : %(termsize)s\n"
+            "Frozen            : %(frozen)s\n"
+            "Log ID            : %(logid)s\n"
+            "%(bar)s\n") % {
+                'bar': '#' * line_width(),
+                'timestamp': str(datetime.now()),
+                'hostname': socket.gethostname(),
+                'platform': platform.platform(),
+                'version': E4S_CL_VERSION,
+                'pyversion': platform.python_version(),
+                'cwd': os.getcwd(),
+                'termsize': 'x'.join([str(_) for _ in term_size()]),
+                'frozen': getattr(sys, 'frozen', False),
+                'logid': LOG_ID,
+            }
 
 
 def update_symlink_latest():
-    if Path(LOG_FILE.parent, LOG_ID).exists():
+    target = Path(LOG_FILE.parent, LOG_ID)
+    if target.exists():
+        # Create the new link next to the current one, then atomically swap
+        # it in place of the latter
+        staging = LOG_LATEST.with_name(f"{LOG_LATEST.name}.{LOG_ID}")
         try:
-            LOG_LATEST.unlink(missing_ok=True)
-            LOG_LATEST.symlink_to(Path(LOG_FILE.parent, LOG_ID))
+            staging.symlink_to(target)
+            os.replace(staging, LOG_LATEST)
         except OSError as err:
             _ROOT_LOGGER.debug("Updating symlink %s failed: %s",
                                LOG_LATEST.as_posix(), str(err))
@@ -466,7 +616,6 @@ def update_symlink_latest():
 
 _ROOT_LOGGER = logging.getLogger()
 if not _ROOT_LOGGER.handlers:
-    _ROOT_LOGGER.setLevel(logging.DEBUG)
     _LOG_FILE_PREFIX = LOG_FILE.parent
 
     # Setup output on stderr
@@ -475,21 +624,23 @@ if not _ROOT_LOGGER.handlers:
     _STDERR_HANDLER.setLevel(LOG_LEVEL)
 
     _ROOT_LOGGER.addHandler(_STDERR_HANDLER)
+    _update_root_level()
 
-# Create a hash for the execution ID, and dictate to dump logs in the
+# Create a random execution ID, and dictate to dump logs in the
 # corresponding folder
 if is_parent():
-    grinder = hashlib.sha256()
-    grinder.update(str(time()).encode())
-
-    LOG_ID = grinder.hexdigest()
+    LOG_ID = secrets.token_hex(32)
     os.environ[LOG_ID_MARKER] = LOG_ID
 else:
     LOG_ID = os.environ.get(LOG_ID_MARKER, 'NOID')
 
 if is_parent():
-    # Add a file handler, location depending on the status of the process
-    add_file_handler(LOG_FILE, _ROOT_LOGGER)
+    # Add a file handler, location depending on the status of the process.
+    # The system information is only gathered if the log file is written to
+    add_file_handler(LOG_FILE,
+                     _ROOT_LOGGER,
+                     header=_banner,
+                     level=FILE_LOG_LEVEL)
 
     # When running as e4s-cl
     if Path(sys.argv[0]).name == 'e4s-cl':
@@ -505,33 +656,6 @@ if is_parent():
         # Registers the update of the latest logs symlink to be run
         # at the end of the execution
         atexit.register(update_symlink_latest)
-
-    # pylint: disable=logging-not-lazy
-    _ROOT_LOGGER.debug(
-        ("\n%(bar)s\n"
-         "E4S CONTAINER LAUNCHER LOGGING INITIALIZED\n"
-         "\n"
-         "Timestamp         : %(timestamp)s\n"
-         "Hostname          : %(hostname)s\n"
-         "Platform          : %(platform)s\n"
-         "Version           : %(version)s\n"
-         "Python Version    : %(pyversion)s\n"
-         "Working Directory : %(cwd)s\n"
-         "Terminal Size     : %(termsize)s\n"
-         "Frozen            : %(frozen)s\n"
-         "Log ID            : %(logid)s\n"
-         "%(bar)s\n") % {
-             'bar': '#' * LINE_WIDTH,
-             'timestamp': str(datetime.now()),
-             'hostname': socket.gethostname(),
-             'platform': platform.platform(),
-             'version': E4S_CL_VERSION,
-             'pyversion': platform.python_version(),
-             'cwd': os.getcwd(),
-             'termsize': 'x'.join([str(_) for _ in TERM_SIZE]),
-             'frozen': getattr(sys, 'frozen', False),
-             'logid': LOG_ID,
-         })
 elif not CONFIGURATION.disable_ranked_log:
     _log_file = Path(_LOG_FILE_PREFIX, LOG_ID, f"e4s_cl.{os.getpid()}")
-    add_file_handler(_log_file, _ROOT_LOGGER)
+    add_file_handler(_log_file, _ROOT_LOGGER, level=FILE_LOG_LEVEL)
@@ -6,6 +6,7 @@ Handles system manipulation and status tasks, e.g. subprocess management or file
 import os
 import re
 import sys
+import shlex
 import subprocess
 from subprocess import DEVNULL, STDOUT
 import pkgutil
@@ -21,6 +22,7 @@ from typing import (
     Union,
 )
 from functools import lru_cache, reduce
+from itertools import chain
 from shutil import which as sh_which
 from collections import deque
 from tarfile import TarFile
@@ -96,6 +98,9 @@ def get_env(var: str) -> Optional[str]:
     )
 
 
+_ACCESS_MODES = {'r': os.R_OK, 'w': os.W_OK, 'x': os.X_OK}
+
+
 def path_accessible(path: Path, mode: str = 'r') -> bool:
     """Check if a file or directory exists and is accessible.
     
@@ -111,22 +116,17 @@ def path_accessible(path: Path, mode: str = 'r') -> bool:
     Returns:
         True if the file exists and can be opened in the specified mode, False otherwise.
     """
-    if isinstance(path, str):
-        path = Path(path)
-
-    modes = {'r': os.R_OK, 'w': os.W_OK, 'x': os.X_OK}
-
     if not mode:
         raise InternalError(f"Unsupported value for mode: '{mode}'")
-    for element in mode:
-        if element not in modes:
-            raise InternalError(f"Unsupported value for mode: '{element}'")
 
     modebits = 0
     for char in mode:
-        modebits |= modes[char]
-    return os.access(path.as_posix(), os.F_OK) and os.access(
-        path.as_posix(), modebits)
+        if char not in _ACCESS_MODES:
+            raise InternalError(f"Unsupported value for mode: '{char}'")
+        modebits |= _ACCESS_MODES[char]
+
+    # R_OK, W_OK and X_OK all fail on missing files
+    return os.access(path, modebits)
 
 
 def run_subprocess(cmd, cwd=None, env=None, discard_output=False) -> int:
@@ -136,7 +136,7 @@ def run_subprocess(cmd, cwd=None, env=None, discard_output=False) -> int:
     Run a subprocess, tailored for end subrocesses
     """
 
-    subproc_env = os.environ
+    subproc_env = os.environ.copy()
     stdout, stderr = sys.stdout, subprocess.PIPE
     if discard_output:
         stdout, stderr = DEVNULL, STDOUT
@@ -159,19 +159,20 @@ def run_subprocess(cmd, cwd=None, env=None, discard_output=False) -> int:
                           stderr=stderr,
                           close_fds=False,
                           universal_newlines=True,
-                          bufsize=1) as proc:
+                          bufsize=-1) as proc:
         # Save the PID for later use
         pid = proc.pid
         # Setup a logger dedicated to this subprocess
         process_logger = logger.setup_process_logger(f"process.{pid}")
         if not discard_output:
             with proc.stderr:
-                # Log the errors in a log file
-                for line in proc.stderr.readlines():
-                    process_logger.error(line[:-1])
-                    buffer.append(line)
+                buffer.extend(proc.stderr)
         returncode = proc.wait()
 
+        # Log the last errors in a log file
+        for line in buffer:
+            process_logger.error(line.rstrip('\n'))
+
     # In case of error, output information
     if returncode:
         LOGGER.error("Process %d failed with code %d", pid, returncode)
@@ -198,7 +199,7 @@ def run_e4scl_subprocess(cmd, cwd=None, env=None, capture_output=False) -> int:
     Run a subprocess, tailored for recursive e4s-cl processes
     """
     with ParentStatus():
-        subproc_env = os.environ
+        subproc_env = os.environ.copy()
         if env:
             for key, val in env.items():
                 if val is None:
@@ -217,7 +218,7 @@ def run_e4scl_subprocess(cmd, cwd=None, env=None, capture_output=False) -> int:
                 stderr=sys.stderr,
                 close_fds=False,
                 universal_newlines=True,
-                bufsize=1) as proc:
+                bufsize=-1) as proc:
 
             output, _ = proc.communicate()
             returncode = proc.returncode
@@ -242,18 +243,13 @@ def get_command_output(cmd):
     Returns:
         str: Subprocess output.
     """
-    key = repr(cmd)
-    try:
-        return get_command_output.cache[key]
-    except AttributeError:
-        get_command_output.cache = {}
-    except KeyError:
-        pass
-    else:
-        _heavy_debug("Using cached output for command: %s", cmd)
+    return _get_command_output(tuple(cmd))
+
+
+@lru_cache(maxsize=None)
+def _get_command_output(cmd):
     LOGGER.debug("Checking subprocess output: %s", cmd)
     stdout = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-    get_command_output.cache[key] = stdout
     _heavy_debug(stdout)
     LOGGER.debug("%s returned 0", cmd)
     return stdout
@@ -263,18 +259,24 @@ def page_output(output_string):
     """Pipe string to a pager.
 
     If PAGER is an environment then use that as pager, otherwise
-    use `less`.
+    use `less`. The string is printed directly if stdout is not a terminal.
 
     Args:
         output_string (str): String to put output.
 
     """
-    if os.environ.get('__E4S_CL_ENABLE_PAGER__', False):
-        pager_cmd = os.environ.get('PAGER', 'less -F -R -S -X -K').split(' ')
-        with subprocess.Popen(pager_cmd, stdin=subprocess.PIPE) as proc:
-            proc.communicate(bytearray(output_string, 'utf-8'))
-    else:
+    if not (os.environ.get('__E4S_CL_ENABLE_PAGER__', False)
+            and sys.stdout.isatty()):
         print(output_string)
+        return
+
+    pager_cmd = shlex.split(os.environ.get('PAGER', 'less -F -R -S -X -K'))
+    with subprocess.Popen(pager_cmd, stdin=subprocess.PIPE) as proc:
+        proc.communicate(output_string.encode())
+
+
+_TRUE_VALUES = frozenset({'1', 't', 'y', 'true', 'yes', 'on'})
+_FALSE_VALUES = frozenset({'0', 'f', 'n', 'false', 'no', 'off', 'none'})
 
 
 def parse_bool(value, additional_true=None, additional_false=None):
@@ -296,12 +298,12 @@ def parse_bool(value, additional_true=None, additional_false=None):
     Raises:
         ValueError: `value` does not parse.
     """
-    true_values = ['1', 't', 'y', 'true', 'yes', 'on']
-    false_values = ['0', 'f', 'n', 'false', 'no', 'off', 'none']
+    true_values = _TRUE_VALUES
+    false_values = _FALSE_VALUES
     if additional_true:
-        true_values.extend(additional_true)
+        true_values = true_values.union(additional_true)
     if additional_false:
-        false_values.extend(additional_false)
+        false_values = false_values.union(additional_false)
     if isinstance(value, str):
         value = value.lower()
         if value in true_values:
@@ -327,8 +329,12 @@ def hline(title, *args, **kwargs):
     Returns:
         str: The horizontal rule.
     """
-    text = f"== {title} ==".ljust(logger.LINE_WIDTH, '=')
-    return color_text(text, *args, **kwargs)
+    return color_text(_hline_text(title, logger.LINE_WIDTH), *args, **kwargs)
+
+
+@lru_cache(maxsize=128)
+def _hline_text(title, width):
+    return f"== {title} ==".ljust(width, '=')
 
 
 def color_text(text, *args, **kwargs):
@@ -356,57 +362,70 @@ def uncolor_text(text):
     Returns:
         str: The text without control chars.
     """
-    return re.sub(_COLOR_CONTROL_RE, '', text)
+    if '\033' not in text:
+        return text
+    return _COLOR_CONTROL_RE.sub('', text)
 
 
-def walk_packages(path, prefix):
+def walk_packages(path, prefix, _seen=None):
     """Fix :any:`pkgutil.walk_packages` to work with Python zip files.
 
     Python's default :any:`zipimporter` doesn't provide an `iter_modules` method so
     :any:`pkgutil.walk_packages` silently fails to list modules and packages when
     they are in a zip file.  This implementation works around this.
     """
-
-    def seen(path, dct={}):  # pylint: disable=dangerous-default-value
-        if path in dct:
-            return True
-        dct[path] = True
-        return False
+    # Paths walked during this call, shared with the recursive calls
+    if _seen is None:
+        _seen = set()
 
     for importer, name, ispkg in _iter_modules(path, prefix):
         yield importer, name, ispkg
         if ispkg:
             __import__(name)
             path = getattr(sys.modules[name], '__path__', None) or []
-            path = [p for p in path if not seen(p)]
-            for item in walk_packages(path, name + '.'):
+            path = [p for p in path if p not in _seen]
+            _seen.update(path)
+            for item in walk_packages(path, name + '.', _seen):
                 yield item
 
 
 def _iter_modules(paths, prefix):
     # pylint: disable=no-member
-    yielded = {}
+    yielded = set()
     for importer, name, ispkg in pkgutil.iter_modules(path=paths,
                                                       prefix=prefix):
         if name not in yielded:
-            yielded[name] = True
+            yielded.add(name)
             yield importer, name, ispkg
 
 
 def flatten(nested_list: List[List[Any]]) -> List[Any]:
     """Flatten a nested list."""
-    return [item for sublist in nested_list for item in sublist]
+    return list(chain.from_iterable(nested_list))
 
 
 def hash256(data: Union[bytes, str]) -> str:
     """
     Create a hash from a string
     """
-    grinder = sha256()
     if isinstance(data, str):
-        data = data.encode()
-    grinder.update(data)
-    return grinder.hexdigest()
+        return _hash256_str(data)
+    return sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _hash256_str(data: str) -> str:
+    return sha256(data.encode()).hexdigest()
+
+
+def _serialize_set(obj):
+    return {'__type': 'set', '__list': list(obj)}
+
+
+# Serializers for specific types, checked before the generic cases
+_JSON_SERIALIZERS = {
+    set: _serialize_set,
+}
 
 
 def _json_serializer(obj):
@@ -414,10 +433,14 @@ def _json_serializer(obj):
     JSON add-on that will transform classes into dicts, and sets into special
     objects to be decoded back into sets with `util.JSONDecoder`.
     """
+    serializer = _JSON_SERIALIZERS.get(type(obj))
+    if serializer is not None:
+        return serializer(obj)
+
     if getattr(obj, '__dict__', False):
         return {'__type': type(obj).__name__, '__dict': obj.__dict__}
     if isinstance(obj, set):
-        return {'__type': 'set', '__list': list(obj)}
+        return _serialize_set(obj)
 
     return obj
 
@@ -465,8 +488,11 @@ def json_loads(*args, **kwargs):
     return json.loads(*args, **kwargs)
 
 
+_SENTENCE_TERMINATORS = ('.', '!', '?')
+
+
 def add_dot(string: str) -> str:
-    if string[-1] in ['.', '!', '?']:
+    if not string or string[-1] in _SENTENCE_TERMINATORS:
         return string
     return string + '.'
 
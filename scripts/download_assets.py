@@ -8,8 +8,12 @@ import os
 import stat
 import sys
 import lzma
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from requests import get
+from typing import Optional
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 from e4s_cl import logger, USER_PREFIX
 from e4s_cl.cf.storage.levels import highest_writable_storage
@@ -20,38 +24,75 @@ LOGGER = logger.get_logger(__name__)
 
 BINARY_DIR = Path(highest_writable_storage().prefix(), SAMPLE_BINARY_TABLE)
 
+# Size of the buffer used when writing the decompressed binaries
+_COPY_BUFFER = 1 << 20
+
+# Number of binaries downloaded concurrently
+_DOWNLOAD_WORKERS = 8
+
+
+def _session() -> Session:
+    """
+    Create a HTTP session able to keep a connection open per download worker
+    """
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=_DOWNLOAD_WORKERS,
+                          pool_maxsize=_DOWNLOAD_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 
 def init_dirs():
     BINARY_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def download_binaries(url: str, available: dict) -> None:
+def _download_binary(session: Session, url: str,
+                     binary: str) -> Optional[Path]:
     """
-    From a dict of {soname, suffix.xz} download and uncompress from the provided URL
+    Download and uncompress a binary from the provided URL, returning the path
+    to the decompressed file, or None on failure
     """
-    for library, binary in available.items():
-        bin_url = f"{url}/{binary}"
-        destination = Path(BINARY_DIR, Path(binary).stem)
-
-        answer = get(bin_url)
+    bin_url = f"{url}/{binary}"
+    destination = Path(BINARY_DIR, Path(binary).stem)
 
+    # Stream the response to avoid holding the whole binary in memory
+    with session.get(bin_url, stream=True) as answer:
         if not answer.ok:
             LOGGER.warning("Failed to access %s", bin_url)
-            continue
+            return None
+
+        # Decode any transfer encoding before the data reaches lzma
+        answer.raw.decode_content = True
+
+        with lzma.LZMAFile(answer.raw) as compressed, \
+                open(destination, "wb") as decompressed:
+            shutil.copyfileobj(compressed, decompressed, _COPY_BUFFER)
+
+    status = os.stat(destination)
+    os.chmod(destination, status.st_mode | stat.S_IEXEC)
 
-        with open(destination, "wb") as decompressed:
-            compressed_data = lzma.LZMADecompressor()
+    return destination
 
-            for chunk in answer.iter_content(chunk_size=8192):
-                decompressed.write(compressed_data.decompress(chunk))
 
-        status = os.stat(destination)
-        os.chmod(destination, status.st_mode | stat.S_IEXEC)
+def download_binaries(session: Session, url: str, available: dict) -> None:
+    """
+    From a dict of {soname, suffix.xz} download and uncompress from the provided URL
+    """
+    # Downloads happen concurrently, but the binaries are recorded from this
+    # thread only as the storage is not thread-safe
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+        destinations = executor.map(
+            lambda binary: _download_binary(session, url, binary),
+            available.values())
 
-        add_precompiled_binary(library, destination.as_posix())
+        for library, destination in zip(available.keys(), destinations):
+            if destination is not None:
+                add_precompiled_binary(library, destination.as_posix())
 
 
-def download_profile(url: str, available: dict, system: str) -> None:
+def download_profile(session: Session, url: str, available: dict,
+                     system: str) -> None:
     """
     If a profile url is returned, download and put its JSON file in the profile directory
     """
@@ -63,7 +104,7 @@ def download_profile(url: str, available: dict, system: str) -> None:
     suffix = available.get(system)
 
     profile_url = f"{url}/{suffix}"
-    answer = get(profile_url)
+    answer = session.get(profile_url)
 
     if not answer.ok:
         LOGGER.warning("Failed to access %s", profile_url)
@@ -87,17 +128,21 @@ def main():
     if len(sys.argv) > 3:
         system = sys.argv[3]
 
-    index = get(f"{url}/index.json")
+    # Share connections between all requests
+    with _session() as session:
+        index = session.get(f"{url}/index.json")
 
-    if not index.ok:
-        LOGGER.error("Failed to download data from %s. Is the URL correct ?",
-                     url)
+        if not index.ok:
+            LOGGER.error(
+                "Failed to download data from %s. Is the URL correct ?", url)
 
-    available = index.json()
+        available = index.json()
 
-    download_binaries(url, available.get('binaries', {}).get(architecture, {}))
-    if system:
-        download_profile(url, available.get('profiles', {}), system)
+        download_binaries(session, url,
+                          available.get('binaries', {}).get(architecture, {}))
+        if system:
+            download_profile(session, url, available.get('profiles', {}),
+                             system)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,9 @@
 import re
+import tempfile
+from pathlib import Path
 import tests
-from e4s_cl.cli.arguments import get_parser
+from e4s_cl.cli.arguments import (get_parser, existing_posix_path_list,
+                                  ArgumentTypeError)
 
 parser_usage = 'do not use'
 parser_description = 'This parser is a test'
@@ -38,3 +41,21 @@ class ArgumentsTests(tests.TestCase):
 
     def test_epilog(self):
         self.assertTrue(re.search(parser_epilog, self.help_string))
+
+    def test_existing_path_list(self):
+        with tempfile.TemporaryDirectory() as directory:
+            files = [Path(directory, name) for name in ('a', 'b')]
+            for file in files:
+                file.touch()
+            link = Path(directory, 'link')
+            link.symlink_to(files[0])
+
+            paths = [*files, link, Path(directory)]
+            self.assertEqual(
+                existing_posix_path_list(','.join(map(str, paths))), paths)
+
+            files[0].unlink()
+            with self.assertRaises(ArgumentTypeError):
+                existing_posix_path_list(str(link))
+            with self.assertRaises(ArgumentTypeError):
+                existing_posix_path_list(f"{files[1]},{files[0]}")
@@ -110,3 +110,37 @@ class ContainerTest(tests.TestCase):
 
         self.assertSetEqual({bind1}, optimize_bind_addition(bind2, {bind1}))
         self.assertSetEqual({bind2}, optimize_bind_addition(bind1, {bind2}))
+
+    def test_bind_files_same_origin(self):
+        container = Container(name='dummy')
+
+        library = Path(tests.ASSETS, 'libgver.so.0')
+        target = Path('/', 'hostlibs', 'libgver.so.0')
+
+        container.bind_files([
+            (library, target, FileOptions.READ_WRITE),
+            (library, target, FileOptions.READ_ONLY),
+        ])
+
+        self.assertSetEqual(
+            {BoundFile(library, target, FileOptions.READ_WRITE)},
+            set(container.bound))
+
+    def test_bind_files_different_origins(self):
+        library = Path(tests.ASSETS, 'libgver.so.0')
+        library_symlink = Path(tests.ASSETS, 'libgver.so.0.0.0')
+        target = Path('/', 'hostlibs', 'libgver.so.0')
+        files = [
+            (library, target, FileOptions.READ_ONLY),
+            (library_symlink, target, FileOptions.READ_ONLY),
+        ]
+
+        # Binding in a batch has the same outcome as binding one at a time
+        container = Container(name='dummy')
+        container.bind_files(files)
+
+        reference = Container(name='dummy')
+        for path, dest, option in files:
+            reference.bind_file(path, dest=dest, option=option)
+
+        self.assertSetEqual(set(reference.bound), set(container.bound))
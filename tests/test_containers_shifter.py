@@ -1,4 +1,4 @@
-from os import getenv, getcwd, environ, pathsep
+from os import getenv, getcwd, environ, pathsep, unlink
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import skipIf
 from pathlib import Path
@@ -43,12 +43,20 @@ backends:
 
 class ContainerTestShifter(tests.TestCase):
 
-    def test_parse_config(self):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
         with NamedTemporaryFile('w', delete=False) as config:
             config.write(SAMPLE_CONFIG)
-            config_file = config.name
+            cls.config_file = config.name
+
+    @classmethod
+    def tearDownClass(cls):
+        unlink(cls.config_file)
+        super().tearDownClass()
 
-        directives = _parse_config(config_file)
+    def test_parse_config(self):
+        directives = _parse_config(self.config_file)
 
         self.assertSetEqual(set(EXPECTED_CONFIG.keys()),
                             set(directives.keys()))
@@ -19,7 +19,7 @@ class ExecuteTests(tests.TestCase):
 
         lib = Library.from_path(linker.resolve("libmpi.so"))
 
-        import_library(lib, container)
+        container.bind_files(import_library(lib, container))
 
         links = set()
         for bound in container.bound:
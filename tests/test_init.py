@@ -3,19 +3,33 @@ Tests ensuring the init command behaves as intented
 """
 
 import os
+import tempfile
+from pathlib import Path
 from itertools import combinations
+from unittest.mock import patch
 import tests
 from tests import TEST_SYSTEM
 from e4s_cl.util import which
 from e4s_cl.model.profile import Profile
 from e4s_cl.cf.libraries import resolve
 from e4s_cl.cf.assets import add_builtin_profile, remove_builtin_profile
-from e4s_cl.cli.commands.init import COMMAND, _compile_sample
+from e4s_cl.cli.commands.init import (COMMAND, _compile_sample,
+                                      _launcher_hosts, _scheduler_hosts,
+                                      _which_many)
+
+# Groups of mutually exclusive options, each given as its argv tokens
+CONFLICTING_GROUPS = [
+    [('--system', TEST_SYSTEM)],
+    [
+        ('--mpi', '/path/to/installation'),
+        ('--launcher', '/path/to/binary'),
+        ('--launcher_args', "'-np 8192'"),
+        ('--quick',),
+    ],
+]
+
 
 class InitTest(tests.TestCase):
-    """
-    Partial class definition: more tests are defined below
-    """
 
     def setUp(self):
         add_builtin_profile(TEST_SYSTEM, {'name': TEST_SYSTEM})
@@ -29,6 +43,54 @@ class InitTest(tests.TestCase):
     def test_compile_bad_compiler(self):
         self.assertIsNone(_compile_sample(which('gcc')))
 
+    @tests.skipUnless(which('mpicc'), "No MPI compiler found")
+    def test_compile_cached(self):
+        binary = _compile_sample(which('mpicc'))
+        self.assertIsNotNone(binary)
+        self.assertEqual(_compile_sample(which('mpicc')), binary)
+
+    def test_scheduler_hosts(self):
+        variables = ('SLURM_JOB_NUM_NODES', 'PBS_NODEFILE', 'LSB_HOSTS')
+        environment = {
+            key: value
+            for key, value in os.environ.items() if key not in variables
+        }
+
+        with patch.dict(os.environ, environment, clear=True):
+            self.assertIsNone(_scheduler_hosts())
+        with patch.dict(os.environ, {**environment, 'SLURM_JOB_NUM_NODES': '4'},
+                        clear=True):
+            self.assertEqual(_scheduler_hosts(), 4)
+        with patch.dict(os.environ, {**environment, 'LSB_HOSTS': 'a a b'},
+                        clear=True):
+            self.assertEqual(_scheduler_hosts(), 2)
+
+    def test_launcher_hosts(self):
+        variables = ('SLURM_JOB_NUM_NODES', 'PBS_NODEFILE', 'LSB_HOSTS')
+        environment = {
+            key: value
+            for key, value in os.environ.items() if key not in variables
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+            # Launcher listing two hosts, then running until terminated
+            launcher = Path(directory, 'launcher')
+            launcher.write_text(
+                "#!/bin/sh\n"
+                "echo node1; echo node2; echo 'aborting' >&2\n"
+                "exec sleep 60\n",
+                encoding='utf-8')
+            launcher.chmod(0o755)
+
+            with patch.dict(os.environ, environment, clear=True):
+                self.assertEqual(_launcher_hosts(launcher.as_posix()), 2)
+
+    def test_which_many(self):
+        found = _which_many({'sh', 'ls', 'this-is-not-a-command'})
+        self.assertEqual(found.get('sh'), which('sh'))
+        self.assertEqual(found.get('ls'), which('ls'))
+        self.assertNotIn('this-is-not-a-command', found)
+
     def test_system(self):
         self.assertCommandReturnValue(0, COMMAND, f"--system {TEST_SYSTEM}")
         self.assertEqual(Profile.controller().selected().get('name'),
@@ -50,32 +112,27 @@ class InitTest(tests.TestCase):
         self.assertEqual(Profile.controller().selected().get('name'),
                          'init_test_profile')
 
-groups = [
-    [('--system', TEST_SYSTEM)],
-    [
-        ('--mpi', '/path/to/installation'),
-        ('--launcher', '/path/to/binary'),
-        ('--launcher_args', "'-np 8192'"),
-    ],
-]
-
-
-def wrapper(option1, value1, option2, value2):
-    """
-    Generate tests from a simple pattern to ensure all fields are correctly added
-    """
-
-    def generated_test(self):
-        self.assertNotCommandReturnValue(0, COMMAND,
-                                         [option1, value1, option2, value2])
-
-    generated_test.__name__ = f"test_{option1.strip('-')}_{option2.strip('-')}"
-
-    return generated_test
-
-
-for conflicting_left, conflicting_right in combinations(groups, 2):
-    for argument1 in conflicting_left:
-        for argument2 in conflicting_right:
-            test = wrapper(*argument1, *argument2)
-            setattr(InitTest, test.__name__, test)
+    @tests.skipUnless(resolve('libmpi.so'), "No MPI library found")
+    def test_quick(self):
+        self.assertCommandReturnValue(0, COMMAND, "--quick")
+        self.assertTrue(Profile.controller().selected().get('libraries'))
+
+    def test_quick_conflicting_arguments(self):
+        # --quick does not run a program, it cannot use the options to do so
+        for arguments in [
+            ('--launcher', 'ls'),
+            ('--launcher_args', "'-np 8192'"),
+            ('hostname', ),
+        ]:
+            with self.subTest(arguments=arguments):
+                self.assertNotCommandReturnValue(0, COMMAND,
+                                                 ['--quick', *arguments])
+
+    def test_conflicting_arguments(self):
+        for left, right in combinations(CONFLICTING_GROUPS, 2):
+            for argument1 in left:
+                for argument2 in right:
+                    with self.subTest(argument1=argument1,
+                                      argument2=argument2):
+                        self.assertNotCommandReturnValue(
+                            0, COMMAND, [*argument1, *argument2])
@@ -0,0 +1,30 @@
+from pathlib import Path
+from unittest.mock import patch
+import tests
+from sotools import Library
+from e4s_cl.cf import libraries
+from e4s_cl.cf.libraries import library_links
+
+
+class LibrariesTest(tests.TestCase):
+
+    def test_library_links_cache(self):
+        library = Library.from_path(Path(tests.ASSETS, 'libgver.so.0'))
+        library_links.cache_clear()
+
+        with patch.object(libraries,
+                          '_library_links',
+                          wraps=libraries._library_links) as scan:
+            links = library_links(library)
+            self.assertIn(Path(tests.ASSETS, 'libgver.so.0'), links)
+
+            # A repeated call does not list the directory again
+            self.assertEqual(library_links(library), links)
+            self.assertEqual(scan.call_count, 1)
+
+            # Clearing the cache invalidates the results
+            library_links.cache_clear()
+            self.assertEqual(library_links(library), links)
+            self.assertEqual(scan.call_count, 2)
+
+        library_links.cache_clear()
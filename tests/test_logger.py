@@ -0,0 +1,115 @@
+import os
+import sys
+import logging
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+import tests
+from e4s_cl import logger
+from e4s_cl.config import Configuration
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    return logging.makeLogRecord({
+        'name': 'test',
+        'levelno': level,
+        'levelname': logging.getLevelName(level),
+        'msg': message,
+    })
+
+
+class LoggerTest(tests.TestCase):
+
+    def test_lazy_color_check(self):
+        logger.stdout_color.cache_clear()
+        formatter = logger.LogFormatter()
+
+        # Creating a formatter does not check the streams
+        self.assertEqual(logger.stdout_color.cache_info().currsize, 0)
+
+        with patch.object(sys, 'stdout', StringIO()):
+            output = formatter.format(
+                _record(logging.INFO, "\x1b[31mmessage\x1b[0m"))
+        logger.stdout_color.cache_clear()
+
+        # The stream is checked on the first record, and not a terminal
+        self.assertEqual(output, "[+] message")
+
+    def test_root_level(self):
+        level = logger.LOG_LEVEL
+        self.addCleanup(logger.set_log_level, level)
+
+        # The root logger lets through the records any handler outputs
+        with patch.object(logger, 'FILE_LOG_LEVEL', logging.WARNING):
+            logger.set_log_level('ERROR')
+            self.assertEqual(logging.getLogger().level, logging.WARNING)
+
+            logger.set_log_level('DEBUG')
+            self.assertEqual(logging.getLogger().level, logging.DEBUG)
+
+    def test_file_log_level(self):
+        configuration = Configuration.create_from_string(
+            "log_file_level: WARNING", complete=True)
+        with patch.object(logger, 'CONFIGURATION', configuration):
+            level = logger._file_log_level()
+        self.assertEqual(level, logging.WARNING)
+
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = Path(directory, 'log')
+            file_logger = logging.getLogger('test_file_log_level')
+            file_logger.propagate = False
+            file_logger.setLevel(logging.DEBUG)
+            logger.add_file_handler(log_file, file_logger, level=level)
+            handler = file_logger.handlers[-1]
+            self.addCleanup(file_logger.removeHandler, handler)
+            self.addCleanup(handler.close)
+
+            file_logger.debug("debug record")
+            file_logger.warning("warning record")
+            handler.flush()
+
+            contents = log_file.read_text(encoding='utf-8')
+            self.assertNotIn("debug record", contents)
+            self.assertIn("warning record", contents)
+
+    def test_lazy_file_handler(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = Path(directory, 'logs', 'log')
+            file_logger = logging.getLogger('test_lazy_file_handler')
+            file_logger.propagate = False
+            file_logger.setLevel(logging.DEBUG)
+            logger.add_file_handler(log_file,
+                                    file_logger,
+                                    header=lambda: "banner")
+            handler = file_logger.handlers[-1]
+            self.addCleanup(file_logger.removeHandler, handler)
+            self.addCleanup(handler.close)
+
+            # The file is created when the first record is emitted
+            self.assertFalse(log_file.exists())
+
+            file_logger.info("first record")
+            file_logger.info("second record")
+            handler.flush()
+
+            lines = log_file.read_text(encoding='utf-8').splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertTrue(lines[0].endswith("banner"))
+            self.assertEqual(sum("banner" in line for line in lines), 1)
+
+    def test_terminal_size_stderr(self):
+        # Output piped to a file, with stderr still attached to a terminal
+        def _terminal_size(fd):
+            if fd == 2:
+                return os.terminal_size((120, 40))
+            raise OSError("Not a terminal")
+
+        environment = {
+            key: value
+            for key, value in os.environ.items()
+            if key not in ('COLUMNS', 'LINES')
+        }
+        with patch.dict(os.environ, environment, clear=True), \
+                patch.object(os, 'get_terminal_size', _terminal_size):
+            self.assertEqual(logger.get_terminal_size(), (120, 40))
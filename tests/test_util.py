@@ -1,9 +1,12 @@
 import os
+import sys
 import tempfile
 import tarfile
 from pathlib import Path
 import tests
-from e4s_cl.util import which, path_accessible, safe_tar
+from e4s_cl.util import (which, path_accessible, safe_tar,
+                         run_e4scl_subprocess, json_dumps, json_loads,
+                         walk_packages)
 
 
 class UtilTest(tests.TestCase):
@@ -24,6 +27,38 @@ class UtilTest(tests.TestCase):
                                          'w'))
         self.assertFalse(path_accessible('/root', 'w'))
 
+    def test_e4scl_subprocess_output(self):
+        # Output larger than a pipe buffer must not block the child
+        size = 1 << 17
+        code, output = run_e4scl_subprocess(
+            [sys.executable, '-c', f"print('x' * {size})"],
+            capture_output=True)
+        self.assertEqual(code, 0)
+        self.assertEqual(len(output), size + 1)
+
+    def test_json(self):
+        data = {'files': ['/tmp/file'], 'libraries': {'libc.so.6'}}
+        self.assertEqual(json_loads(json_dumps(data)), data)
+        self.assertEqual(json_loads(json_dumps(data, indent=2)), data)
+
+        # Paths with undecodable bytes are kept as surrogates
+        data = {'files': ['/tmp/file\udcff']}
+        self.assertEqual(json_loads(json_dumps(data)), data)
+
+    def test_walk_packages(self):
+        import e4s_cl.cli.commands
+
+        def _walk():
+            return [
+                name for _, name, _ in walk_packages(
+                    e4s_cl.cli.commands.__path__, 'e4s_cl.cli.commands.')
+            ]
+
+        modules = _walk()
+        self.assertIn('e4s_cl.cli.commands.profile.list', modules)
+        # Walking the same package again must yield the same modules
+        self.assertEqual(_walk(), modules)
+
     @tests.skipIf(True,
                   "Test hangs for no reason, disabling until fix is found")
     def test_safe_tar(self):